@@ -5,20 +5,152 @@
 Alpenglow Verification Monitoring Server
 
 Provides real-time monitoring dashboard and API for verification pipeline status.
+
+JSON is handled by orjson when it is installed, falling back to the stdlib json
+module for anything orjson cannot represent exactly. One difference remains when
+orjson is used: NaN and Infinity in the status are sent as null, which keeps the
+/api/status body valid JSON.
 """
 
+import hashlib
 import json
 import os
+import re
 import time
 from pathlib import Path
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse
 import threading
 import glob
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson turns integers below -2**63 or above 2**64-1 into floats, so payloads
+# with a number token that long are parsed with json instead. Shorter values such
+# as nanosecond timestamps stay on orjson. The check is a single C-level scan that
+# only runs when a result file changes (see _load_cached_json). The same helper is
+# duplicated in conformance/trace-translator.py, as both scripts run standalone;
+# keep the two in sync.
+_OUT_OF_RANGE_INT = re.compile(rb'(?:^|[:\[,])\s*(?:-\d{19}|\d{20})')
+
+def _json_loads(data):
+    """Parse JSON bytes, using orjson when it is installed and can parse them exactly."""
+    if orjson is not None and not _OUT_OF_RANGE_INT.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity, a UTF-8 BOM, ... are left to the stdlib parser
+            pass
+    return json.loads(data)
+
+def _json_dumps(obj):
+    """Serialize obj to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # Integers beyond 64 bits and other types orjson can't encode
+            pass
+    return json.dumps(obj).encode()
+
+# Parsed result files keyed by path, reused while (mtime, size) is unchanged
+_JSON_CACHE = {}
+_JSON_CACHE_LOCK = threading.Lock()
+
+def _load_cached_json(path):
+    """Load a JSON file, reusing the parsed data if the file has not changed."""
+    st = path.stat()
+    fingerprint = (st.st_mtime_ns, st.st_size)
+    with _JSON_CACHE_LOCK:
+        cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    
+    data = _json_loads(path.read_bytes())
+    
+    with _JSON_CACHE_LOCK:
+        _JSON_CACHE[path] = (fingerprint, data)
+    return data
+
+def _etag_for(paths):
+    """Weak ETag derived from the (mtime, size) of the given files."""
+    fingerprints = []
+    for path in paths:
+        try:
+            st = path.stat()
+            fingerprints.append(f'{st.st_mtime_ns:x}-{st.st_size:x}')
+        except FileNotFoundError:
+            fingerprints.append('missing')
+    digest = hashlib.sha1('/'.join(fingerprints).encode()).hexdigest()[:16]
+    return f'W/"{digest}"'
+
+def _update_from_regression(status, data):
+    """Apply regression test results."""
+    status.update({
+        'total_modules': data.get('total_modules', 0),
+        'total_obligations': data.get('total_obligations', 0),
+        'verified_obligations': data.get('verified_obligations', 0),
+        'obligation_success_rate': data.get('success_rate', 0),
+        'total_runtime': data.get('total_time_seconds', 0)
+    })
+    
+    # Calculate verified/failed modules
+    failed_count = len(data.get('failed_modules', []))
+    status['failed_modules'] = failed_count
+    status['verified_modules'] = status['total_modules'] - failed_count
+    
+    # Calculate average module time
+    if status['total_modules'] > 0:
+        status['avg_module_time'] = status['total_runtime'] // status['total_modules']
+
+def _update_from_parallel(status, data):
+    """Apply parallel verification results."""
+    config = data.get('configuration', {})
+    results = data.get('results', {})
+    
+    status['parallel_workers'] = config.get('workers', 0)
+    
+    # Update with parallel results if more recent
+    if results.get('total_time_seconds', 0) > 0:
+        status.update({
+            'total_runtime': results.get('total_time_seconds', 0),
+            'total_obligations': results.get('total_obligations', 0),
+            'verified_obligations': results.get('verified_obligations', 0),
+            'obligation_success_rate': results.get('obligation_success_rate', 0)
+        })
+
+def _update_from_cross_validation(status, data):
+    """Apply cross-validation results."""
+    status['cross_validation_rate'] = data.get('consistency_rate', 0)
+
+def _update_from_trace_equivalence(status, data):
+    """Apply trace equivalence results."""
+    status['trace_equivalence_rate'] = data.get('equivalence_rate', 0)
+
+def _update_from_performance(status, data):
+    """Apply performance comparison results."""
+    benchmarks = data.get('benchmarks', {})
+    if benchmarks:
+        speedups = [bench.get('speedup', 0) for bench in benchmarks.values()]
+        if speedups:
+            status['performance_speedup'] = sum(speedups) / len(speedups)
+
+# Applied in this order, so later sources override earlier ones
+_RESULT_UPDATERS = {
+    'regression': _update_from_regression,
+    'parallel': _update_from_parallel,
+    'cross-validation': _update_from_cross_validation,
+    'trace equivalence': _update_from_trace_equivalence,
+    'performance': _update_from_performance
+}
+
 class MonitoringHandler(BaseHTTPRequestHandler):
-    def __init__(self, *args, monitoring_dir=None, **kwargs):
+    def __init__(self, *args, monitoring_dir=None, result_paths=None, **kwargs):
         self.monitoring_dir = Path(monitoring_dir) if monitoring_dir else Path('.')
+        self.result_paths = result_paths if result_paths is not None else build_result_paths(self.monitoring_dir)
         super().__init__(*args, **kwargs)
     
     def do_GET(self):
@@ -31,14 +163,36 @@ class MonitoringHandler(BaseHTTPRequestHandler):
         else:
             self.send_error(404)
     
+    def not_modified(self, etag):
+        """Answer 304 if the client's If-None-Match covers etag."""
+        if_none_match = self.headers.get('If-None-Match')
+        if not if_none_match:
+            return False
+        
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        if etag not in tags and '*' not in tags:
+            return False
+        
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        return True
+    
     def serve_dashboard(self):
         dashboard_file = self.monitoring_dir / 'dashboard' / 'index.html'
         try:
+            etag = _etag_for([dashboard_file])
+            if self.not_modified(etag):
+                return
+            
             with open(dashboard_file, 'r') as f:
                 content = f.read()
             
             self.send_response(200)
             self.send_header('Content-type', 'text/html')
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
             self.end_headers()
             self.wfile.write(content.encode())
         except FileNotFoundError:
@@ -46,20 +200,25 @@ class MonitoringHandler(BaseHTTPRequestHandler):
     
     def serve_status_api(self):
         try:
+            # The status only changes when one of the result files does
+            etag = _etag_for(self.result_paths.values())
+            if self.not_modified(etag):
+                return
+            
             status_data = self.collect_status_data()
             
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
             self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
             self.end_headers()
-            self.wfile.write(json.dumps(status_data).encode())
+            self.wfile.write(_json_dumps(status_data))
         except Exception as e:
             self.send_error(500, f'Error collecting status: {str(e)}')
     
     def collect_status_data(self):
         """Collect current verification status from result files."""
-        project_root = self.monitoring_dir.parent.parent
-        
         # Default status
         status = {
             'timestamp': time.time(),
@@ -77,96 +236,14 @@ class MonitoringHandler(BaseHTTPRequestHandler):
             'performance_speedup': 0
         }
         
-        # Check for recent regression test results
-        regression_results = project_root / 'ci-cd' / 'results' / 'regression_test_report.json'
-        if regression_results.exists():
-            try:
-                with open(regression_results, 'r') as f:
-                    data = json.load(f)
-                
-                status.update({
-                    'total_modules': data.get('total_modules', 0),
-                    'total_obligations': data.get('total_obligations', 0),
-                    'verified_obligations': data.get('verified_obligations', 0),
-                    'obligation_success_rate': data.get('success_rate', 0),
-                    'total_runtime': data.get('total_time_seconds', 0)
-                })
-                
-                # Calculate verified/failed modules
-                failed_count = len(data.get('failed_modules', []))
-                status['failed_modules'] = failed_count
-                status['verified_modules'] = status['total_modules'] - failed_count
-                
-                # Calculate average module time
-                if status['total_modules'] > 0:
-                    status['avg_module_time'] = status['total_runtime'] // status['total_modules']
-                    
-            except Exception as e:
-                print(f"Error reading regression results: {e}")
-        
-        # Check for parallel verification results
-        parallel_results = project_root / 'ci-cd' / 'results' / 'parallel' / 'parallel_verification_report.json'
-        if parallel_results.exists():
+        for name, path in self.result_paths.items():
             try:
-                with open(parallel_results, 'r') as f:
-                    data = json.load(f)
-                
-                config = data.get('configuration', {})
-                results = data.get('results', {})
-                
-                status['parallel_workers'] = config.get('workers', 0)
-                
-                # Update with parallel results if more recent
-                if results.get('total_time_seconds', 0) > 0:
-                    status.update({
-                        'total_runtime': results.get('total_time_seconds', 0),
-                        'total_obligations': results.get('total_obligations', 0),
-                        'verified_obligations': results.get('verified_obligations', 0),
-                        'obligation_success_rate': results.get('obligation_success_rate', 0)
-                    })
-                    
+                data = _load_cached_json(path)
+                _RESULT_UPDATERS[name](status, data)
+            except FileNotFoundError:
+                continue
             except Exception as e:
-                print(f"Error reading parallel results: {e}")
-        
-        # Check for cross-validation results
-        cross_val_results = project_root / 'cross-validation' / 'results' / 'dual_framework_summary.json'
-        if cross_val_results.exists():
-            try:
-                with open(cross_val_results, 'r') as f:
-                    data = json.load(f)
-                
-                status['cross_validation_rate'] = data.get('consistency_rate', 0)
-                    
-            except Exception as e:
-                print(f"Error reading cross-validation results: {e}")
-        
-        # Check for trace equivalence results
-        trace_results = project_root / 'cross-validation' / 'results' / 'trace_comparison.json'
-        if trace_results.exists():
-            try:
-                with open(trace_results, 'r') as f:
-                    data = json.load(f)
-                
-                status['trace_equivalence_rate'] = data.get('equivalence_rate', 0)
-                    
-            except Exception as e:
-                print(f"Error reading trace results: {e}")
-        
-        # Check for performance comparison results
-        perf_results = project_root / 'cross-validation' / 'results' / 'performance_comparison.json'
-        if perf_results.exists():
-            try:
-                with open(perf_results, 'r') as f:
-                    data = json.load(f)
-                
-                benchmarks = data.get('benchmarks', {})
-                if benchmarks:
-                    speedups = [bench.get('speedup', 0) for bench in benchmarks.values()]
-                    if speedups:
-                        status['performance_speedup'] = sum(speedups) / len(speedups)
-                    
-            except Exception as e:
-                print(f"Error reading performance results: {e}")
+                print(f"Error reading {name} results: {e}")
         
         return status
     
@@ -174,15 +251,28 @@ class MonitoringHandler(BaseHTTPRequestHandler):
         # Suppress default logging
         pass
 
+def build_result_paths(monitoring_dir):
+    """Build the result file paths read by the status API, in update order."""
+    project_root = Path(monitoring_dir).parent.parent
+    return {
+        'regression': project_root / 'ci-cd' / 'results' / 'regression_test_report.json',
+        'parallel': project_root / 'ci-cd' / 'results' / 'parallel' / 'parallel_verification_report.json',
+        'cross-validation': project_root / 'cross-validation' / 'results' / 'dual_framework_summary.json',
+        'trace equivalence': project_root / 'cross-validation' / 'results' / 'trace_comparison.json',
+        'performance': project_root / 'cross-validation' / 'results' / 'performance_comparison.json'
+    }
+
 def create_handler(monitoring_dir):
+    result_paths = build_result_paths(monitoring_dir)
+    
     def handler(*args, **kwargs):
-        return MonitoringHandler(*args, monitoring_dir=monitoring_dir, **kwargs)
+        return MonitoringHandler(*args, monitoring_dir=monitoring_dir, result_paths=result_paths, **kwargs)
     return handler
 
 def start_monitoring_server(port=8080, monitoring_dir='.'):
     """Start the monitoring server."""
     handler = create_handler(monitoring_dir)
-    server = HTTPServer(('localhost', port), handler)
+    server = ThreadingHTTPServer(('localhost', port), handler)
     
     print(f"🚀 Alpenglow Verification Dashboard started")
     print(f"📊 Dashboard: http://localhost:{port}")
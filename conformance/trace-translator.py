@@ -5,82 +5,62 @@
 Implementation Trace Translator
 
 Converts real Alpenglow implementation traces to TLA+ format for conformance verification.
+
+Traces are parsed with orjson when it is installed, falling back to the stdlib json
+module for input orjson cannot parse exactly, so the output does not depend on it.
 """
 
+import heapq
 import json
 import argparse
 import os
+import re
+import string
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, TextIO, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Same helper as in ci-cd/monitoring/server.py, which explains the out-of-range
+# integer check; keep the two in sync
+_OUT_OF_RANGE_INT = re.compile(rb'(?:^|[:\[,])\s*(?:-\d{19}|\d{20})')
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed and can parse them exactly."""
+    if orjson is not None and not _OUT_OF_RANGE_INT.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity, a UTF-8 BOM, ... are left to the stdlib parser
+            pass
+    return json.loads(data)
+
 class TraceTranslator:
-    def __init__(self, input_dir: str, output_dir: str):
-        self.input_dir = Path(input_dir)
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-    def translate_traces(self) -> bool:
-        """Translate all traces from input directory to TLA+ format."""
-        print(f"Translating traces from {self.input_dir} to {self.output_dir}")
-        
-        success_count = 0
-        total_count = 0
-        
-        # Process each scenario directory
-        for scenario_dir in self.input_dir.iterdir():
-            if not scenario_dir.is_dir():
-                continue
-                
-            print(f"Processing scenario: {scenario_dir.name}")
-            
-            # Collect all validator traces for this scenario
-            validator_traces = []
-            for trace_file in scenario_dir.glob("*.json"):
-                try:
-                    with open(trace_file, 'r') as f:
-                        trace_data = json.load(f)
-                        validator_traces.append(trace_data)
-                        total_count += 1
-                except Exception as e:
-                    print(f"Error reading {trace_file}: {e}")
-                    continue
-            
-            # Translate scenario traces to TLA+ format
-            if validator_traces:
-                tla_trace = self._translate_scenario(scenario_dir.name, validator_traces)
-                output_file = self.output_dir / f"{scenario_dir.name}.tla"
-                
-                try:
-                    with open(output_file, 'w') as f:
-                        f.write(tla_trace)
-                    print(f"Generated TLA+ trace: {output_file}")
-                    success_count += len(validator_traces)
-                except Exception as e:
-                    print(f"Error writing {output_file}: {e}")
-        
-        print(f"Translation completed: {success_count}/{total_count} traces successful")
-        return success_count == total_count
+    # Event type -> (TLA+ action template, event fields filling it after the validator id)
+    EVENT_TEMPLATES = {
+        'consensus_start': ('StartConsensus({}, {}, {})', ('slot', 'view')),
+        'vote_cast': ('CastVote({}, {}, {}, {})', ('slot', 'view', 'block_hash')),
+        'certificate_generated': ('GenerateCertificate({}, {}, {}, "{}")', ('slot', 'view', 'certificate_type'))
+    }
+    EVENT_FIELD_DEFAULTS = {
+        'slot': 1,
+        'view': 1,
+        'block_hash': '"unknown"',
+        'certificate_type': 'fast'
+    }
+    WRITE_BUFFER_SIZE = 1 << 20
     
-    def _translate_scenario(self, scenario_name: str, validator_traces: List[Dict]) -> str:
-        """Translate a scenario's validator traces to TLA+ format."""
-        
-        # Extract events and sort by timestamp
-        all_events = []
-        for trace in validator_traces:
-            validator_id = trace.get('validator_id', 'unknown')
-            for event in trace.get('events', []):
-                event['validator_id'] = validator_id
-                all_events.append(event)
-        
-        # Sort events by timestamp
-        all_events.sort(key=lambda x: x.get('timestamp', 0))
-        
-        # Generate TLA+ trace specification
-        tla_content = f'''---------------------------- MODULE {scenario_name}_trace ----------------------------
+    # TLA+ module text around the per-event CASE lines
+    HEADER_TEMPLATE = string.Template('''---------------------------- MODULE ${name}_trace ----------------------------
 (*
- * Translated execution trace for scenario: {scenario_name}
- * Generated on: {datetime.now().isoformat()}
+ * Translated execution trace for scenario: ${name}
+ * Generated on: ${generated_on}
  * Source: Real Alpenglow implementation traces
  *)
 
@@ -88,7 +68,7 @@ EXTENDS Integers, Sequences, FiniteSets
 INSTANCE Alpenglow
 
 CONSTANTS TraceLength
-ASSUME TraceLength = {len(all_events)}
+ASSUME TraceLength = ${length}
 
 VARIABLES traceStep
 
@@ -97,15 +77,9 @@ TraceInit == traceStep = 0
 TraceNext ==
     \\/ /\\ traceStep < TraceLength
        /\\ traceStep' = traceStep + 1
-       /\\ CASE traceStep = 0 -> {self._translate_event(all_events[0] if all_events else {})}
-'''
-        
-        # Add each event as a case
-        for i, event in enumerate(all_events[1:], 1):
-            tla_content += f'''            [] traceStep = {i} -> {self._translate_event(event)}
-'''
-        
-        tla_content += '''            [] OTHER -> FALSE
+       /\\ CASE traceStep = 0 -> ${first_action}
+''')
+    FOOTER = '''            [] OTHER -> FALSE
     \\/ /\\ traceStep = TraceLength
        /\\ UNCHANGED <<traceStep>>
 
@@ -125,38 +99,146 @@ ConformanceLiveness ==
 
 =============================================================================
 '''
+    
+    def __init__(self, input_dir: str, output_dir: str, workers: Optional[int] = None):
+        self.input_dir = Path(input_dir)
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = workers
         
-        return tla_content
+    def translate_traces(self) -> bool:
+        """Translate all traces from input directory to TLA+ format."""
+        print(f"Translating traces from {self.input_dir} to {self.output_dir}")
+        
+        # One generation timestamp for every scenario in this run
+        self.generated_on = datetime.now().isoformat()
+        
+        scenario_dirs = [d for d in self.input_dir.iterdir() if d.is_dir()]
+        
+        # Scenarios are independent, so translate them in parallel when there are several
+        if self.workers == 1 or len(scenario_dirs) <= 1:
+            results = [self._process_scenario(d) for d in scenario_dirs]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(self._process_scenario, scenario_dirs))
+        
+        success_count = sum(success for success, _ in results)
+        total_count = sum(total for _, total in results)
+        
+        print(f"Translation completed: {success_count}/{total_count} traces successful")
+        return success_count == total_count
     
-    def _translate_event(self, event: Dict[str, Any]) -> str:
-        """Translate a single event to TLA+ action."""
-        event_type = event.get('type', 'unknown')
-        validator_id = event.get('validator_id', 'unknown')
-        
-        if event_type == 'consensus_start':
-            slot = event.get('slot', 1)
-            view = event.get('view', 1)
-            return f'''StartConsensus({validator_id}, {slot}, {view})'''
-            
-        elif event_type == 'vote_cast':
-            slot = event.get('slot', 1)
-            view = event.get('view', 1)
-            block_hash = event.get('block_hash', '"unknown"')
-            return f'''CastVote({validator_id}, {slot}, {view}, {block_hash})'''
-            
-        elif event_type == 'certificate_generated':
-            slot = event.get('slot', 1)
-            view = event.get('view', 1)
-            cert_type = event.get('certificate_type', 'fast')
-            return f'''GenerateCertificate({validator_id}, {slot}, {view}, "{cert_type}")'''
+    def _process_scenario(self, scenario_dir: Path) -> Tuple[int, int]:
+        """Translate one scenario directory, returning (successful, total) trace counts."""
+        print(f"Processing scenario: {scenario_dir.name}")
+        
+        success_count = 0
+        total_count = 0
+        
+        # Collect all validator traces for this scenario
+        try:
+            with os.scandir(scenario_dir) as entries:
+                trace_files = [entry.path for entry in entries
+                               if entry.name.endswith('.json') and entry.is_file()]
+        except OSError as e:
+            print(f"Error reading {scenario_dir}: {e}")
+            return success_count, total_count
+        
+        validator_traces = []
+        for trace_file in trace_files:
+            try:
+                with open(trace_file, 'rb') as f:
+                    raw = f.read()
+                trace_data = _json_loads(raw)
+                validator_traces.append(trace_data)
+                total_count += 1
+            except Exception as e:
+                print(f"Error reading {trace_file}: {e}")
+                continue
+        
+        # Translate scenario traces to TLA+ format
+        if validator_traces:
+            output_file = self.output_dir / f"{scenario_dir.name}.tla"
+            # Stream into a temp file so a failed translation never touches the previous output
+            tmp_file = output_file.with_suffix('.tla.tmp')
             
+            try:
+                with open(tmp_file, 'w', buffering=self.WRITE_BUFFER_SIZE) as f:
+                    self._translate_scenario(scenario_dir.name, validator_traces, f)
+                os.replace(tmp_file, output_file)
+                print(f"Generated TLA+ trace: {output_file}")
+                success_count += len(validator_traces)
+            except Exception as e:
+                tmp_file.unlink(missing_ok=True)
+                print(f"Error translating scenario {scenario_dir.name} to {output_file}: {e}")
+        
+        return success_count, total_count
+    
+    def _translate_scenario(self, scenario_name: str, validator_traces: List[Dict], out: TextIO) -> None:
+        """Translate a scenario's validator traces to TLA+ format, writing to out."""
+        
+        # Extract (timestamp, validator_id, event) entries, leaving the loaded events untouched,
+        # and sort each validator's stream by timestamp
+        timestamp = itemgetter(0)
+        streams = []
+        for trace in validator_traces:
+            validator_id = trace.get('validator_id', 'unknown')
+            events = [(event.get('timestamp', 0), validator_id, event) for event in trace.get('events', [])]
+            # Validator traces are usually already in order, which sorts in linear time
+            streams.append(sorted(events, key=timestamp))
+        
+        # Merge the per-validator streams; ties keep validator order as before
+        all_events = list(heapq.merge(*streams, key=timestamp))
+        
+        # Generate TLA+ trace specification
+        translate_event = self._translate_event
+        if all_events:
+            _, validator_id, event = all_events[0]
+            first_action = translate_event(validator_id, event)
         else:
+            first_action = translate_event('unknown', {})
+        out.write(self.HEADER_TEMPLATE.substitute(
+            name=scenario_name,
+            generated_on=self.generated_on,
+            length=len(all_events),
+            first_action=first_action
+        ))
+        
+        # Add each event as a case
+        out.writelines(f"            [] traceStep = {i} -> {translate_event(validator_id, event)}\n"
+                       for i, (_, validator_id, event) in enumerate(all_events[1:], 1))
+        
+        out.write(self.FOOTER)
+    
+    def _translate_event(self, validator_id: Any, event: Dict[str, Any]) -> str:
+        """Translate a single validator event to TLA+ action."""
+        get = event.get
+        event_type = get('type', 'unknown')
+        
+        # Non-string types (lists, objects) can't be looked up and are always unknown
+        template = self.EVENT_TEMPLATES.get(event_type) if isinstance(event_type, str) else None
+        if template is None:
             return f'''UnknownEvent({validator_id}, "{event_type}")'''
+        
+        action, fields = template
+        defaults = self.EVENT_FIELD_DEFAULTS
+        return action.format(validator_id, *[get(field, defaults[field]) for field in fields])
+
+def positive_int(value: str) -> int:
+    """argparse type for options that must be a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
 
 def main():
     parser = argparse.ArgumentParser(description='Translate implementation traces to TLA+ format')
     parser.add_argument('--input', required=True, help='Input directory containing implementation traces')
     parser.add_argument('--output', required=True, help='Output directory for TLA+ traces')
+    parser.add_argument('--workers', type=positive_int, default=None, help='Number of parallel translation processes (default: CPU count)')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose output')
     
     args = parser.parse_args()
@@ -165,7 +247,7 @@ def main():
         print(f"Input directory: {args.input}")
         print(f"Output directory: {args.output}")
     
-    translator = TraceTranslator(args.input, args.output)
+    translator = TraceTranslator(args.input, args.output, workers=args.workers)
     
     if translator.translate_traces():
         print("✓ All traces translated successfully")